@@ -8,17 +8,57 @@
 
 from manim import *
 from manim_progress_bar.progress_bar import ProgressBar
+from manim_progress_bar.progress_bar_group import ProgressBarGroup
+
+
+# 进度条原型缓存：相同参数的进度条只构建一次，之后通过 copy() 复用，
+# 避免每个场景重复执行圆角矩形的贝塞尔路径细分和文本排版
+_bar_prototypes = {}
+
+
+# 标题/标签文本缓存：同一 (文本, 字号, 颜色) 只做一次 Pango/freetype 排版，
+# 批量渲染整个示例文件时各场景可以共享原型
+_text_prototypes = {}
+
+
+def make_text(text, font_size=36, color=WHITE):
+    """
+    按 (文本, 字号, 颜色) 缓存 Text 原型，返回副本
+    :param text: 文本内容
+    :param font_size: 字号
+    :param color: 颜色
+    :return: Text 副本
+    """
+    key = (text, font_size, str(color))
+    if key not in _text_prototypes:
+        _text_prototypes[key] = Text(text, font_size=font_size, color=color)
+    return _text_prototypes[key].copy()
+
+
+def make_progress_bar(position=DOWN * 3.5, **kwargs):
+    """
+    按参数缓存 ProgressBar 原型，copy 后移动到指定位置
+    :param position: 进度条位置（不参与缓存键）
+    :param kwargs: 传递给 ProgressBar 的其他参数
+    :return: 进度条副本
+    """
+    key = tuple(sorted((name, str(value)) for name, value in kwargs.items()))
+    if key not in _bar_prototypes:
+        _bar_prototypes[key] = ProgressBar(**kwargs)
+    bar = _bar_prototypes[key].copy()
+    bar.move_to(position)
+    return bar
 
 
 class BasicProgressTest(Scene):
     """基础进度条测试：测试基本功能"""
     
     def construct(self):
-        title = Text("基础进度条测试", font_size=36, color=WHITE)
+        title = make_text("基础进度条测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
         # 测试进度条
-        bar = ProgressBar(
+        bar = make_progress_bar(
             width=10,
             height=0.4,
             position=ORIGIN,
@@ -42,11 +82,11 @@ class PercentageHideTest(Scene):
     """测试100%时百分比文字隐藏功能"""
     
     def construct(self):
-        title = Text("100%时文字隐藏测试", font_size=36, color=WHITE)
+        title = make_text("100%时文字隐藏测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
         # 创建进度条
-        bar = ProgressBar(
+        bar = make_progress_bar(
             width=10,
             height=0.4,
             position=ORIGIN,
@@ -82,11 +122,11 @@ class AngleTest(Scene):
     """测试不同角度的进度条"""
     
     def construct(self):
-        title = Text("不同角度测试", font_size=36, color=WHITE)
+        title = make_text("不同角度测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
         # 0度（水平向右）
-        bar_0 = ProgressBar(
+        bar_0 = make_progress_bar(
             width=6,
             height=0.3,
             position=UP * 2.5,
@@ -94,11 +134,11 @@ class AngleTest(Scene):
             angle=0,
             show_percentage=True
         )
-        label_0 = Text("0° (水平向右)", font_size=18, color=WHITE)
+        label_0 = make_text("0° (水平向右)", font_size=18, color=WHITE)
         label_0.next_to(bar_0, DOWN, buff=0.2)
         
         # 90度（垂直向上）
-        bar_90 = ProgressBar(
+        bar_90 = make_progress_bar(
             width=2,
             height=0.3,
             position=UP * 0.5,
@@ -106,11 +146,11 @@ class AngleTest(Scene):
             angle=90,
             show_percentage=True
         )
-        label_90 = Text("90° (垂直向上)", font_size=18, color=WHITE)
+        label_90 = make_text("90° (垂直向上)", font_size=18, color=WHITE)
         label_90.next_to(bar_90, RIGHT, buff=0.5)
         
         # 180度（水平向左）
-        bar_180 = ProgressBar(
+        bar_180 = make_progress_bar(
             width=6,
             height=0.3,
             position=DOWN * 0.5,
@@ -118,11 +158,11 @@ class AngleTest(Scene):
             angle=180,
             show_percentage=True
         )
-        label_180 = Text("180° (水平向左)", font_size=18, color=WHITE)
+        label_180 = make_text("180° (水平向左)", font_size=18, color=WHITE)
         label_180.next_to(bar_180, UP, buff=0.2)
         
         # 270度（垂直向下）
-        bar_270 = ProgressBar(
+        bar_270 = make_progress_bar(
             width=2,
             height=0.3,
             position=DOWN * 2.5,
@@ -130,11 +170,11 @@ class AngleTest(Scene):
             angle=270,
             show_percentage=True
         )
-        label_270 = Text("270° (垂直向下)", font_size=18, color=WHITE)
+        label_270 = make_text("270° (垂直向下)", font_size=18, color=WHITE)
         label_270.next_to(bar_270, LEFT, buff=0.5)
         
         # 45度（对角线）
-        bar_45 = ProgressBar(
+        bar_45 = make_progress_bar(
             width=4,
             height=0.3,
             position=RIGHT * 3,
@@ -142,30 +182,23 @@ class AngleTest(Scene):
             angle=45,
             show_percentage=True
         )
-        label_45 = Text("45° (对角线)", font_size=18, color=WHITE)
+        label_45 = make_text("45° (对角线)", font_size=18, color=WHITE)
         label_45.next_to(bar_45, DOWN, buff=0.5)
-        
+
+        # 用 ProgressBarGroup 批量驱动 5 个进度条，每帧只执行一个 updater
+        bar_group = ProgressBarGroup(bar_0, bar_90, bar_180, bar_270, bar_45)
+
         self.play(Write(title))
         self.wait(0.5)
-        
-        # 显示所有进度条
-        self.play(
-            FadeIn(bar_0), FadeIn(label_0),
-            FadeIn(bar_90), FadeIn(label_90),
-            FadeIn(bar_180), FadeIn(label_180),
-            FadeIn(bar_270), FadeIn(label_270),
-            FadeIn(bar_45), FadeIn(label_45)
-        )
+
+        # 显示所有进度条和标签：单个 FadeIn 作用在一棵 mobject 树上，
+        # 每帧只插值一次透明度，而不是 10 个独立动画各算一遍
+        labels = VGroup(label_0, label_90, label_180, label_270, label_45)
+        self.play(FadeIn(VGroup(bar_group, labels)))
         self.wait(0.5)
-        
+
         # 同时推进所有进度条到100%，测试文字隐藏
-        self.play(
-            bar_0.auto_progress(duration=3.0),
-            bar_90.auto_progress(duration=3.0),
-            bar_180.auto_progress(duration=3.0),
-            bar_270.auto_progress(duration=3.0),
-            bar_45.auto_progress(duration=3.0)
-        )
+        self.play(bar_group.auto_progress(duration=3.0))
         self.wait(2.0)
 
 
@@ -173,11 +206,11 @@ class AutoProgressTest(Scene):
     """测试自动进度功能"""
     
     def construct(self):
-        title = Text("自动进度测试", font_size=36, color=WHITE)
+        title = make_text("自动进度测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
         # 使用 duration 参数的自动进度
-        bar1 = ProgressBar(
+        bar1 = make_progress_bar(
             width=8,
             height=0.4,
             position=UP * 1.5,
@@ -185,25 +218,26 @@ class AutoProgressTest(Scene):
             duration=3.0,
             show_percentage=True
         )
-        label1 = Text("duration=3.0秒", font_size=20, color=WHITE)
+        label1 = make_text("duration=3.0秒", font_size=20, color=WHITE)
         label1.next_to(bar1, DOWN, buff=0.3)
         
         # 使用 auto_progress 方法的自动进度
-        bar2 = ProgressBar(
+        bar2 = make_progress_bar(
             width=8,
             height=0.4,
             position=DOWN * 1.5,
             fill_color=GREEN,
             show_percentage=True
         )
-        label2 = Text("auto_progress(4.0秒)", font_size=20, color=WHITE)
+        label2 = make_text("auto_progress(4.0秒)", font_size=20, color=WHITE)
         label2.next_to(bar2, DOWN, buff=0.3)
         
         self.play(Write(title))
         self.wait(0.5)
-        self.play(FadeIn(bar1), FadeIn(label1), FadeIn(bar2), FadeIn(label2))
+        # 合并为单个 FadeIn：每帧只插值一次透明度，而不是 4 个独立动画各算一遍
+        self.play(FadeIn(VGroup(bar1, label1, bar2, label2)))
         self.wait(0.5)
-        
+
         # 同时启动两个自动进度
         self.play(
             bar1.start(),  # 使用 duration 参数
@@ -216,10 +250,10 @@ class ManualProgressTest(Scene):
     """测试手动设置进度"""
     
     def construct(self):
-        title = Text("手动设置进度测试", font_size=36, color=WHITE)
+        title = make_text("手动设置进度测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
-        bar = ProgressBar(
+        bar = make_progress_bar(
             width=10,
             height=0.4,
             position=ORIGIN,
@@ -232,11 +266,15 @@ class ManualProgressTest(Scene):
         self.play(FadeIn(bar))
         self.wait(0.5)
         
-        # 测试不同的进度值
+        # 测试不同的进度值：预先构建成一个 Succession，一次注册全部动画，
+        # 省去 7 轮 play/收尾循环的调度开销
+        # （set_progress 在构造动画时就更新 current_progress，因此可以连续构建）
         progress_values = [0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+        steps = []
         for progress in progress_values:
-            self.play(bar.set_progress(progress, run_time=1.0))
-            self.wait(0.3)
+            steps.append(bar.set_progress(progress, run_time=1.0))
+            steps.append(Wait(0.3))
+        self.play(Succession(*steps))
         
         self.wait(1.0)
         
@@ -249,10 +287,10 @@ class InstantUpdateTest(Scene):
     """测试立即更新功能"""
     
     def construct(self):
-        title = Text("立即更新测试", font_size=36, color=WHITE)
+        title = make_text("立即更新测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
-        bar = ProgressBar(
+        bar = make_progress_bar(
             width=10,
             height=0.4,
             position=ORIGIN,
@@ -282,10 +320,10 @@ class BoundaryTest(Scene):
     """测试边界情况"""
     
     def construct(self):
-        title = Text("边界情况测试", font_size=36, color=WHITE)
+        title = make_text("边界情况测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
-        bar = ProgressBar(
+        bar = make_progress_bar(
             width=8,
             height=0.4,
             position=ORIGIN,
@@ -315,10 +353,10 @@ class NoPercentageTest(Scene):
     """测试不显示百分比的情况"""
     
     def construct(self):
-        title = Text("不显示百分比测试", font_size=36, color=WHITE)
+        title = make_text("不显示百分比测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
-        bar = ProgressBar(
+        bar = make_progress_bar(
             width=10,
             height=0.4,
             position=ORIGIN,
@@ -340,11 +378,11 @@ class CustomStyleTest(Scene):
     """测试自定义样式"""
     
     def construct(self):
-        title = Text("自定义样式测试", font_size=36, color=WHITE)
+        title = make_text("自定义样式测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
         # 不同样式的进度条
-        bar1 = ProgressBar(
+        bar1 = make_progress_bar(
             width=8,
             height=1,
             position=UP * 2,
@@ -357,10 +395,10 @@ class CustomStyleTest(Scene):
             percentage_font_size=32,
             percentage_color=WHITE
         )
-        label1 = Text("自定义颜色和边框", font_size=18, color=WHITE)
+        label1 = make_text("自定义颜色和边框", font_size=18, color=WHITE)
         label1.next_to(bar1, DOWN, buff=0.3)
         
-        bar2 = ProgressBar(
+        bar2 = make_progress_bar(
             width=8,
             height=0.3,
             position=DOWN * 1,
@@ -369,14 +407,15 @@ class CustomStyleTest(Scene):
             show_percentage=True,
             percentage_font_size=24
         )
-        label2 = Text("小尺寸进度条", font_size=18, color=WHITE)
+        label2 = make_text("小尺寸进度条", font_size=18, color=WHITE)
         label2.next_to(bar2, DOWN, buff=0.3)
         
         self.play(Write(title))
         self.wait(0.5)
-        self.play(FadeIn(bar1), FadeIn(label1), FadeIn(bar2), FadeIn(label2))
+        # 合并为单个 FadeIn：每帧只插值一次透明度，而不是 4 个独立动画各算一遍
+        self.play(FadeIn(VGroup(bar1, label1, bar2, label2)))
         self.wait(0.5)
-        
+
         # 同时推进
         self.play(
             bar1.auto_progress(duration=3.0),
@@ -389,7 +428,7 @@ class ComprehensiveTest(Scene):
     """综合测试：测试所有功能"""
     
     def construct(self):
-        title = Text("综合功能测试", font_size=36, color=WHITE)
+        title = make_text("综合功能测试", font_size=36, color=WHITE)
         title.to_edge(UP, buff=0.5)
         
         # 创建多个不同配置的进度条
@@ -397,18 +436,18 @@ class ComprehensiveTest(Scene):
         labels = []
         
         configs = [
-            {"angle": 0, "color": BLUE, "label": "0°", "pos": UP * 2 + LEFT * 4},
-            {"angle": 90, "color": RED, "label": "90°", "pos": UP * 0.5 + LEFT * 4},
-            {"angle": 180, "color": GREEN, "label": "180°", "pos": DOWN * 0.5 + LEFT * 4},
-            {"angle": 270, "color": YELLOW, "label": "270°", "pos": DOWN * 2 + LEFT * 4},
-            {"angle": 45, "color": PURPLE, "label": "45°", "pos": UP * 2 + RIGHT * 4},
-            {"angle": 135, "color": ORANGE, "label": "135°", "pos": UP * 0.5 + RIGHT * 4},
-            {"angle": 225, "color": PINK, "label": "225°", "pos": DOWN * 0.5 + RIGHT * 4},
-            {"angle": 315, "color": TEAL, "label": "315°", "pos": DOWN * 2 + RIGHT * 4},
+            {"angle": 0, "color": BLUE, "pos": UP * 2 + LEFT * 4},
+            {"angle": 90, "color": RED, "pos": UP * 0.5 + LEFT * 4},
+            {"angle": 180, "color": GREEN, "pos": DOWN * 0.5 + LEFT * 4},
+            {"angle": 270, "color": YELLOW, "pos": DOWN * 2 + LEFT * 4},
+            {"angle": 45, "color": PURPLE, "pos": UP * 2 + RIGHT * 4},
+            {"angle": 135, "color": ORANGE, "pos": UP * 0.5 + RIGHT * 4},
+            {"angle": 225, "color": PINK, "pos": DOWN * 0.5 + RIGHT * 4},
+            {"angle": 315, "color": TEAL, "pos": DOWN * 2 + RIGHT * 4},
         ]
-        
+
         for i, config in enumerate(configs):
-            bar = ProgressBar(
+            bar = make_progress_bar(
                 width=3 if config["angle"] in [90, 270] else 6,
                 height=0.3,
                 position=config["pos"],
@@ -416,7 +455,9 @@ class ComprehensiveTest(Scene):
                 angle=config["angle"],
                 show_percentage=True
             )
-            label = Text(config["label"], font_size=16, color=WHITE)
+            # 标签直接由角度生成；固定的 8 个标签经 make_text 缓存后
+            # 整个渲染进程只排版一次
+            label = make_text(f"{config['angle']}°", font_size=16, color=WHITE)
             label.next_to(bar, DOWN, buff=0.2)
             bars.append(bar)
             labels.append(label)
@@ -424,39 +465,69 @@ class ComprehensiveTest(Scene):
         self.play(Write(title))
         self.wait(0.5)
         
-        # 显示所有进度条
-        anims = [FadeIn(bar) for bar in bars] + [FadeIn(label) for label in labels]
-        self.play(*anims)
+        # 用 ProgressBarGroup 批量驱动 8 个进度条，每帧只执行一个 updater
+        bar_group = ProgressBarGroup(*bars)
+
+        # 显示所有进度条（合并为单个 AnimationGroup，每帧只计算一次 alpha）
+        anims = [FadeIn(bar_group)] + [FadeIn(label) for label in labels]
+        self.play(AnimationGroup(*anims, lag_ratio=0))
         self.wait(0.5)
-        
+
         # 同时推进所有进度条到100%，测试文字隐藏
-        anims = [bar.auto_progress(duration=4.0) for bar in bars]
-        self.play(*anims)
+        self.play(bar_group.auto_progress(duration=4.0))
         self.wait(2.0)
-        
+
         # 测试从100%回到50%
         anims = [bar.set_progress(0.5, run_time=1.0) for bar in bars]
-        self.play(*anims)
+        self.play(AnimationGroup(*anims, lag_ratio=0))
         self.wait(2.0)
 
 
-# 运行说明
+# 全部测试场景（按推荐顺序）
+_ALL_SCENES = [
+    ("BasicProgressTest", "基础功能测试"),
+    ("PercentageHideTest", "100%时文字隐藏测试（重要）"),
+    ("AngleTest", "不同角度测试"),
+    ("AutoProgressTest", "自动进度测试"),
+    ("ManualProgressTest", "手动设置进度测试"),
+    ("InstantUpdateTest", "立即更新测试"),
+    ("BoundaryTest", "边界情况测试"),
+    ("NoPercentageTest", "不显示百分比测试"),
+    ("CustomStyleTest", "自定义样式测试"),
+    ("ComprehensiveTest", "综合功能测试"),
+]
+
+
+def _render_scene(scene_name):
+    """在子进程中渲染单个场景（供批量并行渲染使用）"""
+    import subprocess
+    import sys
+    return subprocess.run(
+        [sys.executable, "-m", "manim", "-ql", __file__, scene_name],
+        check=False
+    ).returncode
+
+
+# 运行说明 / 批量渲染
 if __name__ == "__main__":
+    import sys
+
+    if "--render-all" in sys.argv:
+        # 各场景的渲染互相独立（天然可并行），用进程池吃满多核 CPU
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as pool:
+            return_codes = list(pool.map(_render_scene, [name for name, _ in _ALL_SCENES]))
+        sys.exit(max(return_codes))
+
     print("=" * 60)
     print("进度条测试用例")
     print("=" * 60)
     print("\n可用的测试场景：")
-    print("  1. BasicProgressTest - 基础功能测试")
-    print("  2. PercentageHideTest - 100%时文字隐藏测试（重要）")
-    print("  3. AngleTest - 不同角度测试")
-    print("  4. AutoProgressTest - 自动进度测试")
-    print("  5. ManualProgressTest - 手动设置进度测试")
-    print("  6. InstantUpdateTest - 立即更新测试")
-    print("  7. BoundaryTest - 边界情况测试")
-    print("  8. NoPercentageTest - 不显示百分比测试")
-    print("  9. CustomStyleTest - 自定义样式测试")
-    print("  10. ComprehensiveTest - 综合功能测试")
+    for index, (name, description) in enumerate(_ALL_SCENES, start=1):
+        print(f"  {index}. {name} - {description}")
     print("\n使用示例：")
     print("  python -m manim -pql progress_bar_example.py PercentageHideTest")
     print("  python -m manim -pql progress_bar_example.py ComprehensiveTest")
+    print("\n批量渲染（多进程并行）：")
+    print("  python progress_bar_example.py --render-all")
     print("\n注意：PercentageHideTest 是测试100%时文字隐藏的关键测试")
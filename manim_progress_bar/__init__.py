@@ -5,6 +5,7 @@ A customizable progress bar component for Manim animations.
 """
 
 from .progress_bar import ProgressBar
+from .progress_bar_group import ProgressBarGroup
 
 __version__ = "0.2.0"
-__all__ = ["ProgressBar"]
+__all__ = ["ProgressBar", "ProgressBarGroup"]
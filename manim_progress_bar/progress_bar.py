@@ -27,32 +27,177 @@ Usage:
 
 from manim import *
 import numpy as np
+import math
+import os
 import logging
 
 # 配置日志记录器
 logger = logging.getLogger(__name__)
 
-# 如果 logger 还没有处理器，则添加一个控制台处理器
-if not logger.handlers:
+
+def enable_debug_logging():
+    """
+    为本模块的 logger 挂一个 DEBUG 级别的控制台处理器
+    也可以通过环境变量 MANIM_PROGRESS_BAR_DEBUG 在导入时开启
+    """
+    if logger.handlers and not all(
+        isinstance(h, logging.NullHandler) for h in logger.handlers
+    ):
+        return
+
     # 创建控制台处理器
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)
-    
+
     # 创建格式器
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(formatter)
-    
+
     # 添加处理器到 logger
     logger.addHandler(console_handler)
     logger.setLevel(logging.DEBUG)
-    
+
     # 防止日志传播到根 logger（避免重复输出）
     logger.propagate = False
 
 
+# 库代码默认保持安静（标准库推荐的 NullHandler 模式）；
+# 调试输出按需开启，批量渲染反复导入时不再构造处理器、刷 stderr
+if os.environ.get("MANIM_PROGRESS_BAR_DEBUG"):
+    enable_debug_logging()
+else:
+    logger.addHandler(logging.NullHandler())
+
+
+# smooth() 缓动查找表：1024 个采样点一次性算好，动画每帧只做一次整型索引，
+# 代替逐帧的多项式求值；并发进度条越多、帧率越高，节省越明显
+_SMOOTH_LUT = np.array([smooth(t) for t in np.linspace(0.0, 1.0, 1024)])
+
+
+def lut_smooth(alpha):
+    """
+    查表版 smooth 缓动函数（1024 档，精度约 1e-3，低于单帧可见差异）
+    :param alpha: 动画进度（0-1）
+    :return: 缓动后的进度值
+    """
+    if alpha <= 0.0:
+        return 0.0
+    if alpha >= 1.0:
+        return 1.0
+    return float(_SMOOTH_LUT[int(alpha * 1023.0)])
+
+
+def _clamp01(x):
+    """
+    把数值钳制到 [0, 1]（纯标量三元表达式，不经过 max/min 的多参数分发）
+    :param x: 任意浮点数
+    :return: 钳制后的值
+    """
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+
+
+def _progress_to_fill_length(progress, total_length, min_size):
+    """
+    纯标量计算：把进度值换算为填充条沿进度方向的长度
+    与 mobject 完全无关，动画每帧调用时只有几次浮点运算
+    :param progress: 进度值（0-1）
+    :param total_length: 背景在进度方向上的总长度
+    :param min_size: 填充条的最小长度
+    :return: 填充条长度
+    """
+    # 满进度快速返回精确总长；其余情况用 min/max 一行完成钳制，
+    # 负进度、超界进度都落在同一表达式里，不再走分支级联
+    if progress >= 1.0:
+        return total_length
+    return max(min_size, min(total_length, total_length * progress))
+
+
+def _fill_bar_geometry(progress, total_length, min_size, half_length,
+                       fill_height, dir_cos, dir_sin, bg_x, bg_y, bg_z):
+    """
+    纯标量几何核：由进度直接算出填充条的 (长, 高, 中心x, 中心y, 中心z)
+    所有输入都是 Python 浮点数，函数体内没有任何数组运算或属性访问，
+    是每帧热路径的最内层
+    :param progress: 进度值（0-1）
+    :param total_length: 背景在进度方向上的总长度
+    :param min_size: 填充条最小长度
+    :param half_length: 背景总长的一半
+    :param fill_height: 填充条高度
+    :param dir_cos: 进度方向单位向量的 x 分量
+    :param dir_sin: 进度方向单位向量的 y 分量
+    :param bg_x: 背景中心 x
+    :param bg_y: 背景中心 y
+    :param bg_z: 背景中心 z
+    :return: (length, height, center_x, center_y, center_z) 元组
+    """
+    fill_length = _progress_to_fill_length(progress, total_length, min_size)
+    offset = fill_length * 0.5 - half_length
+    return (
+        fill_length,
+        fill_height,
+        bg_x + dir_cos * offset,
+        bg_y + dir_sin * offset,
+        bg_z,
+    )
+
+
+# 四个基本方向的只读单位向量：方向解析的快速分支直接返回这些常量，
+# 不再每次调用都分配 3 元素数组（设为只读，防止调用方原地改写共享值）
+_DIR_RIGHT = np.array([1.0, 0.0, 0.0])
+_DIR_UP = np.array([0.0, 1.0, 0.0])
+_DIR_LEFT = np.array([-1.0, 0.0, 0.0])
+_DIR_DOWN = np.array([0.0, -1.0, 0.0])
+for _vec in (_DIR_RIGHT, _DIR_UP, _DIR_LEFT, _DIR_DOWN):
+    _vec.flags.writeable = False
+del _vec
+
+
+# 百分比文本缓存：同一 (文本, 字体, 字号, 颜色) 组合只做一次字形排版，
+# 之后通过 copy() 复用，避免每次进度变化都重新走 Pango/Cairo 的文本排版
+_PERCENTAGE_TEXT_CACHE = {}
+
+
+def _make_percentage_text(text, style_key, style_kwargs):
+    """
+    按样式缓存百分比 Text 原型，返回可直接使用的副本
+    :param text: 文本内容（如 "50%"）
+    :param style_key: 样式缓存键（构造期算好的可哈希元组）
+    :param style_kwargs: 传给 Text 的样式参数字典（构造期打包好）
+    :return: Text 副本
+    """
+    key = (text,) + style_key
+    prototype = _PERCENTAGE_TEXT_CACHE.get(key)
+    if prototype is None:
+        prototype = Text(text, **style_kwargs)
+        _PERCENTAGE_TEXT_CACHE[key] = prototype
+    return prototype.copy()
+
+
+class _ProgressAnimation(Animation):
+    """
+    A minimal Animation that maps alpha straight onto a progress value.
+
+    UpdateFromAlphaFunc routes every frame through the generic
+    family-iteration machinery in Animation.interpolate_mobject; for a
+    progress bar the per-frame work is a single _apply_progress call, so
+    this subclass overrides interpolate_mobject and does exactly that.
+    """
+
+    def __init__(self, bar, start_progress, progress_range, **kwargs):
+        super().__init__(bar, **kwargs)
+        self._start_progress = start_progress
+        self._progress_range = progress_range
+
+    def interpolate_mobject(self, alpha):
+        # 语义与 UpdateFromAlphaFunc 一致：rate_func 在这里应用
+        self.mobject._apply_progress(
+            self._start_progress + self._progress_range * self.rate_func(alpha)
+        )
+
+
 class ProgressBar(VGroup):
     """
     A customizable progress bar component for Manim animations.
@@ -141,20 +286,23 @@ class ProgressBar(VGroup):
         """
         angle_deg = angle_deg % 360
         if abs(angle_deg - 0) < 1e-6 or abs(angle_deg - 360) < 1e-6:
-            return np.array([1.0, 0.0, 0.0])
+            return _DIR_RIGHT
         elif abs(angle_deg - 90) < 1e-6:
-            return np.array([0.0, 1.0, 0.0])
+            return _DIR_UP
         elif abs(angle_deg - 180) < 1e-6:
-            return np.array([-1.0, 0.0, 0.0])
+            return _DIR_LEFT
         elif abs(angle_deg - 270) < 1e-6:
-            return np.array([0.0, -1.0, 0.0])
+            return _DIR_DOWN
         else:
-            direction_vec = np.array([np.cos(angle_rad), np.sin(angle_rad), 0.0])
+            # 标量三角函数用 math 模块（绕过 NumPy 的 ufunc 分发），
+            # 二维模长用 math.hypot 代替 np.linalg.norm
+            cos_a = math.cos(angle_rad)
+            sin_a = math.sin(angle_rad)
             # 归一化方向向量，确保是单位向量
-            norm = np.linalg.norm(direction_vec[:2])
+            norm = math.hypot(cos_a, sin_a)
             if norm > 1e-10:
-                return np.array([direction_vec[0] / norm, direction_vec[1] / norm, 0.0])
-            return direction_vec
+                return np.array([cos_a / norm, sin_a / norm, 0.0])
+            return np.array([cos_a, sin_a, 0.0])
     
     def __init__(
         self,
@@ -192,70 +340,171 @@ class ProgressBar(VGroup):
         
         # 存储角度（转换为弧度）
         self.angle = angle
-        self.angle_rad = np.radians(angle)
-        
-        # 计算动态最小尺寸：对于圆角矩形，宽度至少需要是2倍的圆角半径，否则会被挤压变形
-        # 填充条使用 corner_radius * 0.9，所以最小宽度应该是 2 * (corner_radius * 0.9)
-        fill_corner_radius = corner_radius * 0.9
-        self.MIN_SIZE = max(self.BASE_MIN_SIZE, 2 * fill_corner_radius)
-        
-        # 创建背景（始终使用 width 和 height，不交换）
-        self.background = RoundedRectangle(
-            width=width,
-            height=height,
-            corner_radius=corner_radius,
-            fill_color=background_color,
-            fill_opacity=0.3,
-            stroke_color=border_color,
-            stroke_width=border_width
+        self.angle_rad = math.radians(angle)
+
+        # 轴对齐特化：大多数场景使用四个基本方向，无需走通用旋转管线
+        # - 0°/180°：矩形本身即为最终朝向（对称圆角矩形旋转180°不变）
+        # - 90°/270°：直接交换宽高构造，省去构造后对每个顶点做 rotate()
+        angle_norm = angle % 360
+        self._axis_swap = abs(angle_norm - 90) < 1e-6 or abs(angle_norm - 270) < 1e-6
+        self._needs_rotate = not (
+            self._axis_swap
+            or angle_norm < 1e-6
+            or abs(angle_norm - 180) < 1e-6
+            or abs(angle_norm - 360) < 1e-6
         )
         
+        # 计算动态最小尺寸：对于圆角矩形，宽度至少需要是2倍的圆角半径，否则会被挤压变形
+        # 填充条圆角半径略小于背景（corner_radius * 0.9），构造期算好常量
+        self._fill_corner_radius = corner_radius * 0.9
+        self.MIN_SIZE = max(self.BASE_MIN_SIZE, 2 * self._fill_corner_radius)
+        
+        # 创建背景（90°/270° 时交换宽高直接构造为最终朝向）
+        # corner_radius 为 0 时退化为普通 Rectangle：4 个顶点的直线路径，
+        # Cairo 光栅化比圆角的贝塞尔子路径便宜得多
+        bg_width, bg_height = (height, width) if self._axis_swap else (width, height)
+        if corner_radius > 0:
+            self.background = RoundedRectangle(
+                width=bg_width,
+                height=bg_height,
+                corner_radius=corner_radius,
+                fill_color=background_color,
+                fill_opacity=0.3,
+                stroke_color=border_color,
+                stroke_width=border_width
+            )
+        else:
+            self.background = Rectangle(
+                width=bg_width,
+                height=bg_height,
+                fill_color=background_color,
+                fill_opacity=0.3,
+                stroke_color=border_color,
+                stroke_width=border_width
+            )
+
         # 计算沿角度方向的单位向量（使用精确值避免浮点数误差）
+        # 角度构造后不再变化；热路径只用它的标量分量（_angle_cos/_angle_sin）
         direction_vec = self._get_direction_vector(self.angle, self.angle_rad)
-        
+
         self.bg_half_length = width / 2
-        
-        # 旋转背景到指定角度
-        self.background.rotate(self.angle_rad)
+
+        # 仅非轴对齐角度需要旋转背景
+        if self._needs_rotate:
+            self.background.rotate(self.angle_rad)
         self.add(self.background)
         
-        # 创建填充条（初始宽度很小）
+        # 创建填充条：只构造一次“满长度、未旋转、中心在原点”的模板，
+        # 记下它的点阵；此后每帧更新只对这份点阵做一次向量化的
+        # 缩放+旋转+平移，不再重建 RoundedRectangle（免去每帧的
+        # 贝塞尔圆角细分和 mobject 分配）
         fill_height = self.original_height * self.FILL_HEIGHT_RATIO
-        self.fill_bar = self._create_fill_bar(self.MIN_SIZE, fill_height)
-        
+        self._fill_height = fill_height
+        self._bg_total_length = float(width)
+        # 模板缩放用的倒数（构造期部分求值：热路径乘法代替除法）
+        self._inv_bg_total_length = 1.0 / self._bg_total_length
+        self._inv_fill_height = 1.0 / fill_height
+        # 旋转用的精确 cos/sin（取自方向向量，基本方向为精确的 0/±1）
+        self._angle_cos = float(direction_vec[0])
+        self._angle_sin = float(direction_vec[1])
+        self.fill_bar = self._create_fill_bar(width, fill_height)
+        self._fill_template_points = self.fill_bar.points.copy()
+        self._fill_points_buf = np.empty_like(self._fill_template_points)
+
+        # 上次应用的填充条几何状态（宽、高、中心），用于跳过亚像素级的重复更新
+        self._last_fill_state = None
+
+        # 预分配的中心坐标缓冲：热路径每帧原地改写，不再构造 [x, y, z] 列表
+        self._center_buf = np.zeros(3)
+
+        # 按 round(progress, 4) 记忆化的填充条几何结果，背景移动时清空
+        self._fill_props_cache = {}
+
+        # 上次应用的量化进度（None 表示需要强制重新应用）
+        self._last_applied_key = None
+
         # 计算起点位置（沿角度方向的负方向，从中心点开始）
         bg_center = self.background.get_center()
         start_offset = -self.bg_half_length + self.MIN_SIZE / 2
         start_pos = bg_center + direction_vec * start_offset
-        
-        # 旋转填充条到对应角度并设置位置
-        self.fill_bar.rotate(self.angle_rad)
-        self.fill_bar.move_to(start_pos)
+
+        # 把填充条置为初始（最小）长度并放到起点
+        self._update_fill_bar(self.MIN_SIZE, fill_height, start_pos)
         self.add(self.fill_bar)
         
+        # 文本样式参数构造期一次性规范化：样式字典直接展开给 Text，
+        # 缓存键（含 str(color) 转换）也只算这一次，取文本时不再重复解析
+        self._text_style = dict(
+            font=percentage_font,
+            font_size=percentage_font_size,
+            color=percentage_color,
+            weight=BOLD,
+            stroke_width=0.3,
+            stroke_color=percentage_color,
+        )
+        self._text_style_key = (percentage_font, percentage_font_size, str(percentage_color))
+
+        # 按实例缓存的百分比文本（0-100 懒加载），换字时直接替换子对象
+        # 槽位复用，热路径上连模块级缓存的 copy() 都省掉
+        self._pct_text_cache = {}
+
         # 创建百分比文本
+        # show_percentage=False 时完全不创建 Text mobject（字形排版开销不小），
+        # 显式置为 None，保证不存在“隐藏但仍参与渲染”的休眠文本
         if show_percentage:
             self.percentage_text = self._create_percentage_text(0)
             self.percentage_text.move_to(self.background.get_center())
             self.add(self.percentage_text)
+        else:
+            self.percentage_text = None
+
+        # 百分比文本是否挂在子对象列表里（布尔标志代替每帧的线性查找）
+        self._pct_text_added = show_percentage
+
+        # 百分比文本当前是否不透明（幂等保护：不重复写同样的透明度）
+        self._pct_text_opaque = show_percentage
         
         # 移动到指定位置
         self.move_to(position)
-        
+
         # 当前进度（0-1）
         self.current_progress = 0.0
+
+        # 上次显示的整数百分比（初始文本即 "0%"），用于跳过同值换字
+        self._last_percentage = 0
+
+        # start() 只是 auto_progress() 的无参别名：直接绑定同一个方法，
+        # 调用时少走一层 Python 栈帧
+        self.start = self.auto_progress
+
+        # 初始化按动画缓存的背景几何量
+        self._refresh_geometry_cache()
     
     def _create_fill_bar(self, width, height):
-        """创建填充条"""
-        fill_bar = RoundedRectangle(
-            width=width,
-            height=height,
-            corner_radius=self.corner_radius * 0.9,  # 填充条圆角半径略小于背景
-            fill_color=self.fill_color,
-            fill_opacity=1.0,
-            stroke_width=0,  # 明确设置描边宽度为0
-            stroke_opacity=0
-        )
+        """
+        创建填充条模板（未旋转、中心在原点，width 为沿进度方向的长度）
+        朝向与尺寸由 _update_fill_bar 中的点阵变换完成
+        """
+        # 与背景一致：无圆角时使用普通 Rectangle，省掉贝塞尔圆角路径
+        if self.corner_radius > 0:
+            fill_bar = RoundedRectangle(
+                width=width,
+                height=height,
+                corner_radius=self._fill_corner_radius,  # 填充条圆角半径略小于背景
+                fill_color=self.fill_color,
+                fill_opacity=1.0,
+                stroke_width=0,  # 明确设置描边宽度为0
+                stroke_opacity=0
+            )
+        else:
+            fill_bar = Rectangle(
+                width=width,
+                height=height,
+                fill_color=self.fill_color,
+                fill_opacity=1.0,
+                stroke_width=0,
+                stroke_opacity=0
+            )
         # 明确设置所有颜色相关属性，确保颜色饱满，无描边
         fill_bar.set_fill(color=self.fill_color, opacity=1.0)
         fill_bar.set_stroke(width=0, opacity=0)
@@ -263,341 +512,347 @@ class ProgressBar(VGroup):
         return fill_bar
     
     def _create_percentage_text(self, percentage):
-        """创建百分比文本"""
-        return Text(
+        """创建百分比文本（命中缓存时只复制，不重新排版字形）"""
+        return _make_percentage_text(
             f"{percentage}%",
-            font=self.percentage_font,
-            font_size=self.percentage_font_size,
-            color=self.percentage_color,
-            weight=BOLD,
-            stroke_width=0.3,
-            stroke_color=self.percentage_color
+            self._text_style_key,
+            self._text_style
         )
+
+    def _get_percentage_text(self, percentage):
+        """
+        取得某个整数百分比的文本（按实例缓存，懒加载）
+        返回对象在实例内共享：同一时刻只有一个会挂在子对象列表里，
+        可见性等状态在换入时统一重设
+        :param percentage: 整数百分比（0-100）
+        :return: 缓存的 Text 对象
+        """
+        cached = self._pct_text_cache.get(percentage)
+        if cached is None:
+            cached = self._create_percentage_text(percentage)
+            # 入缓存时就摆到背景中心：热路径 become 前不再逐帧 move_to，
+            # 背景移动后由 _refresh_geometry_cache 统一重摆
+            cached.move_to(self._bg_center)
+            self._pct_text_cache[percentage] = cached
+        return cached
     
+    def __deepcopy__(self, clone_from_id):
+        """
+        深拷贝时剥离懒加载缓存
+        Animation 每次 play 前都会深拷贝整个 mobject 作为起始状态；
+        随动画推进 _pct_text_cache 会攒下上百个 Text，逐份拷贝会让
+        动画启动越来越慢。缓存内容都能按需重建，副本从空缓存开始即可
+        """
+        pct_cache = self._pct_text_cache
+        props_cache = self._fill_props_cache
+        self._pct_text_cache = {}
+        self._fill_props_cache = {}
+        try:
+            result = super().__deepcopy__(clone_from_id)
+        finally:
+            self._pct_text_cache = pct_cache
+            self._fill_props_cache = props_cache
+        return result
+
+    def _swap_percentage_text(self, percentage):
+        """
+        把当前百分比文本换成缓存中对应的 Text（O(1) 子对象槽位替换）
+        become 需要整树拷贝目标的点阵与样式；缓存文本已经预排版、
+        预定位，直接替换子对象列表里的引用即可
+        :param percentage: 整数百分比（0-100）
+        """
+        new_text = self._get_percentage_text(percentage)
+        if new_text is self.percentage_text:
+            return
+        if self._pct_text_added:
+            idx = self.submobjects.index(self.percentage_text)
+            self.submobjects[idx] = new_text
+        self.percentage_text = new_text
+        # 换字只发生在应当可见的进度段；换入的缓存文本透明度可能是旧值
+        # （例如曾在 100% 时被整体隐藏），在换入处立即恢复可见性，
+        # 所有换字路径都不会出现空白帧
+        new_text.set_opacity(1.0)
+        new_text.set_fill_opacity(1.0)
+        new_text.set_stroke_opacity(1.0)
+        self._pct_text_opaque = True
+
+    def _refresh_geometry_cache(self):
+        """
+        刷新按动画缓存的背景几何量
+        进度动画期间背景相对不动，每帧调用 get_center()（遍历子对象点阵求
+        包围盒）是纯重复劳动；在每个动画/更新入口处刷新一次即可。
+        如果在两次动画之间移动了进度条，下一次入口调用会自动取到新位置
+        （此时缓存的百分比文本也会统一重摆到新中心）
+        """
+        new_center = self.background.get_center()
+        old_center = getattr(self, "_bg_center", None)
+        self._bg_center = new_center
+        # 标量分量单独缓存，几何核只接收 Python 浮点数
+        self._bg_cx = float(new_center[0])
+        self._bg_cy = float(new_center[1])
+        self._bg_cz = float(new_center[2])
+        if old_center is None or not np.array_equal(new_center, old_center):
+            # 背景中心变了：按进度记忆化的几何结果全部作废、强制下一次
+            # 应用，缓存文本统一重摆（懒加载缓存最多 101 条，且只在动画
+            # 入口发生，不在每帧热路径上）
+            self._fill_props_cache.clear()
+            self._last_applied_key = None
+            for text in self._pct_text_cache.values():
+                text.move_to(new_center)
+
     def _update_fill_bar(self, width, height, center):
-        """更新填充条的尺寸和位置"""
-        # 创建新的填充条
-        new_fill_bar = self._create_fill_bar(width, height)
-        new_fill_bar.rotate(self.angle_rad)
-        new_fill_bar.move_to(center)
-        # 在替换之前，强制设置颜色和不透明度，确保颜色饱满，无描边
-        new_fill_bar.set_fill(color=self.fill_color, opacity=1.0)
-        new_fill_bar.set_stroke(width=0, opacity=0)
-        new_fill_bar.set_opacity(1.0)
-        # 使用 become 直接替换，避免 remove/add 可能导致的颜色混合问题
-        self.fill_bar.become(new_fill_bar)
-        # 再次强制设置颜色和描边，确保 become 后颜色仍然正确，无白色框
-        self.fill_bar.set_fill(color=self.fill_color, opacity=1.0)
-        self.fill_bar.set_stroke(width=0, opacity=0)
-        self.fill_bar.set_opacity(1.0)
-        
-    
+        """更新填充条的尺寸和位置（原地改写点阵，不重建 mobject）"""
+        # 先把几何量对齐到 1e-3 场景单位（约 1/7 像素）的网格再应用：
+        # 相邻帧的插值结果经常落在同一格里（低帧率渲染时尤其明显），
+        # 量化后与上一帧相同的直接跳过，不做任何路径重建
+        width = round(width, 3)
+        height = round(height, 3)
+        center = (round(center[0], 3), round(center[1], 3), round(center[2], 3))
+        state = (width, height, center)
+        if state == self._last_fill_state:
+            return
+        self._last_fill_state = state
+
+        # 对模板点阵做 缩放→旋转→平移 的向量化变换，结果直接写回填充条
+        # 的点阵缓冲：几何上等价于按目标尺寸重建圆角矩形再旋转移动，
+        # 但整个过程没有任何 mobject 构造，也不触碰颜色属性
+        template = self._fill_template_points
+        buf = self._fill_points_buf
+        scaled_x = template[:, 0] * (width * self._inv_bg_total_length)
+        scaled_y = template[:, 1] * (height * self._inv_fill_height)
+        cos_a = self._angle_cos
+        sin_a = self._angle_sin
+        buf[:, 0] = scaled_x * cos_a - scaled_y * sin_a
+        buf[:, 0] += center[0]
+        buf[:, 1] = scaled_x * sin_a + scaled_y * cos_a
+        buf[:, 1] += center[1]
+        buf[:, 2] = center[2]
+        self.fill_bar.points[:] = buf
+
     def _calculate_fill_bar_properties(self, progress):
         """
         根据进度和角度计算填充条的属性（宽度/高度和位置）
+        结果按 round(progress, 4) 记忆化（4 位小数已在亚像素精度以下）；
+        往返动画、分段动画会反复经过同一批进度值，直接命中缓存。
+        缓存随 _refresh_geometry_cache 在背景移动时失效
         :param progress: 进度值（0-1）
         :return: (width, height, center_x, center_y, center_z) 元组
         """
-        # 计算沿角度方向的单位向量
-        direction_vec = self._get_direction_vector(self.angle, self.angle_rad)
-        
-        # 背景在角度方向上的总长度
-        bg_total_length = 2 * self.bg_half_length
-        
-        # 填充条的高度
-        fill_height = self.original_height * self.FILL_HEIGHT_RATIO
-        
-        # 计算填充条在角度方向上的长度
-        if progress <= 0:
-            fill_length = self.MIN_SIZE
-        elif progress >= 1.0:
-            fill_length = bg_total_length
-        else:
-            fill_length = max(self.MIN_SIZE, bg_total_length * progress)
-        
-        # 计算填充条的中心位置
-        bg_center = self.background.get_center()
-        start_offset = -self.bg_half_length + fill_length / 2
-        fill_center = bg_center + direction_vec * start_offset
-        
-        return (fill_length, fill_height, fill_center[0], fill_center[1], fill_center[2])
+        key = round(progress, 4)
+        cached = self._fill_props_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # 全部输入都取构造期/入口处缓存好的标量，委托给模块级几何核
+        props = _fill_bar_geometry(
+            progress,
+            self._bg_total_length,
+            self.MIN_SIZE,
+            self.bg_half_length,
+            self._fill_height,
+            self._angle_cos,
+            self._angle_sin,
+            self._bg_cx,
+            self._bg_cy,
+            self._bg_cz,
+        )
+        self._fill_props_cache[key] = props
+        return props
     
-    def set_progress(self, progress, run_time=1.0):
+    def _apply_fill_geometry(self, progress):
+        """
+        按进度取（记忆化的）几何结果并原地应用到填充条
+        中心坐标写入预分配缓冲，整个调用不产生任何新数组或列表
+        :param progress: 进度值（0-1）
+        """
+        fill_width, fill_height, cx, cy, cz = self._calculate_fill_bar_properties(progress)
+        center = self._center_buf
+        center[0] = cx
+        center[1] = cy
+        center[2] = cz
+        self._update_fill_bar(fill_width, fill_height, center)
+
+    def set_progress(self, progress, run_time=1.0, rate_func=lut_smooth):
         """
         设置进度条进度
         :param progress: 进度值（0-1之间）
         :param run_time: 动画时间
+        :param rate_func: 缓动函数（默认查表版 lut_smooth）。连续链式调用 set_progress 时，
+            每段动画都会在零速度处重新启动，产生停顿感；中间段传入 linear
+            （或首尾段传入 ease_out/ease_in）可以让速度平滑衔接
         :return: 动画对象
         """
-        progress = max(0.0, min(1.0, progress))  # 限制在0-1之间
-        
-        # 计算起始填充条属性（使用当前进度）
-        start_width, start_height, start_x, start_y, start_z = self._calculate_fill_bar_properties(self.current_progress)
-        
-        # 计算目标填充条属性
-        target_width, target_height, target_x, target_y, target_z = self._calculate_fill_bar_properties(progress)
-        
+        progress = _clamp01(progress)  # 限制在0-1之间
+
+        # 平凡情形特化：零时长等价于立即更新，进度不变则无事可做，
+        # 两种情况都不值得搭建整组插值动画
+        if run_time <= 0:
+            self.update_progress_instant(progress)
+            return Wait(0)
+        if progress == self.current_progress:
+            return Wait(run_time)
+
+        # 动画入口：刷新一次背景几何缓存，整段动画复用
+        self._refresh_geometry_cache()
+
+        # 起止进度：只插值进度这一个标量，几何量走按进度记忆化的计算
+        start_progress_val = self.current_progress
+        progress_span = progress - start_progress_val
+
         # 更新当前进度
         self.current_progress = progress
-        
+
         # 创建动画列表
         anims = []
-        
+
         def update_fill_bar(mob, alpha):
-            """更新填充条：重新创建以确保填充颜色完整"""
-            # 计算当前属性（线性插值）
-            current_width = start_width + (target_width - start_width) * alpha
-            current_height = start_height + (target_height - start_height) * alpha
-            current_x = start_x + (target_x - start_x) * alpha
-            current_y = start_y + (target_y - start_y) * alpha
-            current_z = start_z + (target_z - start_z) * alpha
-            
-            # 确保最小尺寸
-            current_width = max(self.MIN_SIZE, current_width)
-            current_height = max(self.MIN_SIZE, current_height)
-            
-            # 更新填充条
-            self._update_fill_bar(current_width, current_height, [current_x, current_y, current_z])
-            
-            # 强制刷新颜色属性，防止动画过程中颜色变淡或被混合
-            # 必须在添加到 VGroup 之后再次设置，确保颜色正确，无白色框
-            if self.fill_bar in self.submobjects:
-                self.fill_bar.set_fill(color=self.fill_color, opacity=1.0)
-                self.fill_bar.set_stroke(width=0, opacity=0)
-                self.fill_bar.set_opacity(1.0)
+            """更新填充条：插值进度后经记忆化的几何计算原地应用"""
+            self._apply_fill_geometry(start_progress_val + progress_span * alpha)
+            # 本路径绕过 _apply_progress，其量化早退键不再反映实际状态，
+            # 置空以强制动画结束后的下一次 _apply_progress 完整应用
+            self._last_applied_key = None
         
         anims.append(
             UpdateFromAlphaFunc(
                 self,
                 update_fill_bar,
-                run_time=run_time
+                run_time=run_time,
+                rate_func=rate_func
             )
         )
         
         # 更新百分比文本
         if self.show_percentage:
             if progress >= 1.0:
-                # 进度达到100%时，先隐藏文本，然后在动画结束时移除
-                def hide_and_remove(mob, alpha):
-                    # 在动画过程中逐渐隐藏
-                    opacity = max(0.0, 1.0 - alpha)
-                    self.percentage_text.set_opacity(opacity)
-                    self.percentage_text.set_fill_opacity(opacity)
-                    self.percentage_text.set_stroke_opacity(opacity)
-                    # 动画结束时移除
-                    if alpha >= 1.0 and self.percentage_text in self.submobjects:
-                        self.remove(self.percentage_text)
-                
-                anims.append(UpdateFromAlphaFunc(self, hide_and_remove, run_time=run_time))
+                # 进度达到100%：用逐帧回调淡出。回调在每帧才读取
+                # self.percentage_text（晚绑定），预先构建的动画序列里换过
+                # 字后淡出的仍是当前文本；不能用带 remover 的 FadeOut——
+                # 它会在 clean_up_from_scene 里把嵌套子对象从场景中拆走并
+                # 恢复为不透明。文本保留在子对象里、透明度归零，
+                # 与 _apply_progress 在 100% 时的隐藏语义一致
+                def fade_out_text(mob, alpha):
+                    opacity = 1.0 - alpha
+                    if opacity < 0.0:
+                        opacity = 0.0
+                    text = self.percentage_text
+                    text.set_opacity(opacity)
+                    text.set_fill_opacity(opacity)
+                    text.set_stroke_opacity(opacity)
+                    self._pct_text_opaque = False
+
+                anims.append(UpdateFromAlphaFunc(self, fade_out_text, run_time=run_time, rate_func=rate_func))
             else:
-                # 确保文本存在且可见
-                if self.percentage_text not in self.submobjects:
+                # 确保文本存在且可见（标志位判断，不扫描子对象列表）
+                if not self._pct_text_added:
                     self.add(self.percentage_text)
+                    self._pct_text_added = True
                 current_opacity = self.percentage_text.get_opacity()
                 if current_opacity is None or current_opacity < 1.0:
                     anims.append(self.percentage_text.animate.set_opacity(1.0).set_fill_opacity(1.0).set_stroke_opacity(1.0))
-                
-                # 更新文本内容
-                percentage = int(progress * 100)
-                new_text = self._create_percentage_text(percentage)
-                new_text.move_to(self.background.get_center())
-                anims.append(Transform(self.percentage_text, new_text))
+
+                # 文本换字直接替换为预排版、预定位的缓存文本，
+                # 并让百分比随动画逐帧递增显示
+                start_pct = int(start_progress_val * 100)
+                pct_range = int(progress * 100) - start_pct
+
+                def update_text(mob, alpha):
+                    pct = start_pct + int(pct_range * alpha)
+                    if pct == self._last_percentage:
+                        return
+                    self._last_percentage = pct
+                    self._swap_percentage_text(pct)
+
+                anims.append(UpdateFromAlphaFunc(self, update_text, run_time=run_time, rate_func=rate_func))
         
         return AnimationGroup(*anims, run_time=run_time)
-    
-    
+
     def update_progress_instant(self, progress):
         """
         立即更新进度（无动画）
         :param progress: 进度值（0-1）
         """
-        progress = max(0.0, min(1.0, progress))
-        self.current_progress = progress
-        
-        # 使用辅助方法计算填充条属性
-        fill_width, fill_height, fill_center_x, fill_center_y, fill_center_z = self._calculate_fill_bar_properties(progress)
-        
-        # 更新填充条
-        self._update_fill_bar(fill_width, fill_height, [fill_center_x, fill_center_y, fill_center_z])
-        
+        self._refresh_geometry_cache()
+        self._apply_progress(progress)
+
+    def _apply_progress(self, progress):
+        """
+        把给定进度直接应用到填充条与百分比文本（无动画）
+        动画与 updater 的每帧热路径都收敛到这一个函数
+        :param progress: 进度值（0-1，超出范围会被钳制）
+        """
+        progress = _clamp01(progress)
+
+        # 合并式早退：进度量化到与几何记忆化相同的 1e-4 档后与上一帧一致，
+        # 则填充条和百分比文本都不会有可见变化，记录进度值后直接返回
+        key = round(progress, 4)
+        if key == self._last_applied_key:
+            self.current_progress = progress
+            return
+        self._last_applied_key = key
+
+        # 计算并应用填充条几何（中心坐标写入预分配缓冲，零分配）
+        self._apply_fill_geometry(progress)
+
         # 更新百分比文本
         if self.show_percentage:
             if progress >= 1.0:
-                # 进度达到100%时，直接移除百分比文本
-                self.remove(self.percentage_text)
+                # 100% 时一次性隐藏（与 update_progress_instant 的语义一致）
+                if self._pct_text_opaque:
+                    self.percentage_text.set_opacity(0.0)
+                    self.percentage_text.set_fill_opacity(0.0)
+                    self.percentage_text.set_stroke_opacity(0.0)
+                    self._pct_text_opaque = False
             else:
-                # 确保文本存在且可见
-                if self.percentage_text not in self.submobjects:
-                    self.add(self.percentage_text)
-                self.percentage_text.set_opacity(1.0)
-                self.percentage_text.set_fill_opacity(1.0)
-                self.percentage_text.set_stroke_opacity(1.0)
-                
-                # 更新文本内容
+                # 整数百分比每帧只换算一次；与上一帧相同时跳过换字
                 percentage = int(progress * 100)
-                new_text = self._create_percentage_text(percentage)
-                new_text.move_to(self.background.get_center())
-                self.remove(self.percentage_text)
-                self.percentage_text = new_text
-                self.add(self.percentage_text)
-    
-    def auto_progress(self, duration=None, start_progress=0.0, end_progress=1.0):
+                if percentage != self._last_percentage:
+                    self._last_percentage = percentage
+                    self._swap_percentage_text(percentage)
+
+                # 确保文本存在且可见（标志位判断，不扫描子对象列表；
+                # 透明度只在状态真正变化时写一次，不逐帧重复遍历整树）
+                if not self._pct_text_added:
+                    self.add(self.percentage_text)
+                    self._pct_text_added = True
+                if not self._pct_text_opaque:
+                    self.percentage_text.set_opacity(1.0)
+                    self.percentage_text.set_fill_opacity(1.0)
+                    self.percentage_text.set_stroke_opacity(1.0)
+                    self._pct_text_opaque = True
+
+        # 更新当前进度
+        self.current_progress = progress
+
+    def auto_progress(self, duration=None, start_progress=0.0, end_progress=1.0, rate_func=lut_smooth):
         """
         自动推进进度条（根据时间参数自动计算每一帧的进度）
         按照指定时间计算每一帧应该往前走多少，达到时间后进度条走满
         :param duration: 总时长（秒），如果为None则使用初始化时设置的duration
         :param start_progress: 起始进度（0-1），默认0
         :param end_progress: 结束进度（0-1），默认1.0（100%）
+        :param rate_func: 缓动函数（默认查表版 lut_smooth）。分段衔接多个进度动画时，
+            传入 linear 等缓动函数可以避免每段都从零速度重新启动
         :return: 动画对象
         """
         # 使用用户设置的duration，如果没有则使用参数中的duration
         if duration is None:
-            if self.duration is None:
-                duration = 5.0  # 默认5秒
-            else:
-                duration = self.duration
-        
-        start_progress = max(0.0, min(1.0, start_progress))
-        end_progress = max(0.0, min(1.0, end_progress))
-        
-        # 初始化起始状态
+            duration = 5.0 if self.duration is None else self.duration
+
+        start_progress = _clamp01(start_progress)
+        end_progress = _clamp01(end_progress)
+        progress_range = end_progress - start_progress
+
+        # 初始化起始状态（同时刷新背景几何缓存，整段动画复用）
         self.update_progress_instant(start_progress)
-        
-        # 清除之前的updater（如果存在）
-        self.clear_updaters()
-        
-        # 使用ValueTracker跟踪时间（从0到duration）
-        # 存储为实例变量，确保updater能正确访问
-        self._time_tracker = ValueTracker(0.0)
-        self._auto_duration = duration
-        self._auto_start_progress = start_progress
-        self._auto_end_progress = end_progress
-        self._auto_progress_range = end_progress - start_progress
-        
-        # 标记是否已经清理过updater，避免重复清理
-        self._updater_cleared = False
-        
-        # 创建更新函数：根据时间计算进度
-        def update_progress(mob):
-            # 获取当前时间
-            current_time = self._time_tracker.get_value()
-            
-            # 根据时间计算进度（线性插值）
-            # progress = start + (current_time / duration) * range
-            if current_time <= 0:
-                progress = self._auto_start_progress
-            elif current_time >= self._auto_duration:
-                progress = self._auto_end_progress
-                # 当达到目标进度且时间已到，标记需要清理updater
-                # 实际清理将在动画的update_func中完成，避免在updater执行过程中清理
-                if not self._updater_cleared:
-                    self._updater_cleared = True
-            else:
-                # 线性插值：每一帧根据当前时间计算精确进度
-                progress = self._auto_start_progress + (current_time / self._auto_duration) * self._auto_progress_range
-            
-            # 确保 progress 被限制在有效范围内
-            if progress >= 1.0:
-                progress = 1.0
-            
-            # 使用辅助方法计算填充条属性
-            fill_width, fill_height, fill_center_x, fill_center_y, fill_center_z = self._calculate_fill_bar_properties(progress)
-            
-            # 更新填充条
-            self._update_fill_bar(fill_width, fill_height, [fill_center_x, fill_center_y, fill_center_z])
-            
-            # 强制刷新颜色属性，防止动画过程中颜色变淡或被混合，无白色框
-            if self.fill_bar in self.submobjects:
-                self.fill_bar.set_fill(color=self.fill_color, opacity=1.0)
-                self.fill_bar.set_stroke(width=0, opacity=0)
-                self.fill_bar.set_opacity(1.0)
-            
-            # 更新百分比文本
-            if self.show_percentage:
-                if progress >= 1.0:
-                    # 进度达到100%时，直接移除百分比文本
-                    if self.percentage_text in self.submobjects:
-                        self.remove(self.percentage_text)
-                else:
-                    # 确保文本存在且可见
-                    if self.percentage_text not in self.submobjects:
-                        self.add(self.percentage_text)
-                    self.percentage_text.set_opacity(1.0)
-                    self.percentage_text.set_fill_opacity(1.0)
-                    self.percentage_text.set_stroke_opacity(1.0)
-                    
-                    # 更新文本内容
-                    percentage = int(progress * 100)
-                    new_text = self._create_percentage_text(percentage)
-                    new_text.move_to(self.background.get_center())
-                    self.percentage_text.become(new_text)
-            
-            # 更新当前进度
-            self.current_progress = progress
-        
-        # 绑定更新函数到整个VGroup
-        # updater会在每一帧被调用，根据time_tracker的值更新进度
-        self.add_updater(update_progress)
-        
-        # 创建动画：让time_tracker从0变化到duration
-        # 当time_tracker变化时，updater会自动调用，更新进度条
-        # 使用 UpdateFromAlphaFunc 动画，根据动画进度更新 ValueTracker
-        # 这样可以确保 run_time 被正确设置
-        def update_func(mob, alpha):
-            """根据动画进度更新 time_tracker，并在动画结束时清理updater
-            alpha: 动画进度，从0到1
-            """
-            # alpha 从 0 到 1，对应 time_tracker 从 0 到 duration
-            # time_tracker 的值直接对应时间，updater 会根据这个时间计算进度
-            current_time = alpha * self._auto_duration
-            self._time_tracker.set_value(current_time)
-            
-            # 当动画结束时（alpha >= 1.0），确保进度条到达最终状态后再清理updater
-            if alpha >= 1.0 and not self._updater_cleared:
-                # 确保进度条已经更新到最终状态
-                final_progress = self._auto_end_progress
-                fill_width, fill_height, fill_center_x, fill_center_y, fill_center_z = self._calculate_fill_bar_properties(final_progress)
-                self._update_fill_bar(fill_width, fill_height, [fill_center_x, fill_center_y, fill_center_z])
-                self.current_progress = final_progress
-                
-                # 更新百分比文本
-                if self.show_percentage:
-                    if final_progress >= 1.0:
-                        if self.percentage_text in self.submobjects:
-                            self.remove(self.percentage_text)
-                    else:
-                        if self.percentage_text not in self.submobjects:
-                            self.add(self.percentage_text)
-                        self.percentage_text.set_opacity(1.0)
-                        self.percentage_text.set_fill_opacity(1.0)
-                        self.percentage_text.set_stroke_opacity(1.0)
-                        percentage = int(final_progress * 100)
-                        new_text = self._create_percentage_text(percentage)
-                        new_text.move_to(self.background.get_center())
-                        self.percentage_text.become(new_text)
-                
-                # 清理updater
-                self.clear_updaters()
-                self._updater_cleared = True
-        
-        # 创建 UpdateFromAlphaFunc 动画，直接设置 run_time
-        # UpdateFromAlphaFunc 会自动传递 alpha 参数（动画进度 0-1）
-        anim = UpdateFromAlphaFunc(
-            self._time_tracker,
-            update_func,
-            run_time=duration
+
+        # 专用动画类：绕过 UpdateFromAlphaFunc 的通用分发，每帧只有
+        # 一次 _apply_progress 调用（rate_func 在动画类内部应用）
+        return _ProgressAnimation(
+            self,
+            start_progress,
+            progress_range,
+            run_time=duration,
+            rate_func=rate_func
         )
-        
-        # 返回动画对象
-        # 注意：动画执行过程中，updater会在每一帧更新进度
-        # 当进度达到目标值（通常是100%）时，updater会自动清理
-        return anim
-    
-    def start(self):
-        """
-        开始自动推进进度条（使用初始化时设置的duration）
-        如果初始化时没有设置duration，则使用默认值5秒
-        :return: 动画对象
-        """
-        return self.auto_progress()
+
 
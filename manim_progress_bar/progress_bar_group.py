@@ -0,0 +1,86 @@
+"""
+Manim Progress Bar Group
+
+A container that drives several ProgressBar instances in lockstep.
+"""
+
+from manim import *
+import numpy as np
+
+from .progress_bar import lut_smooth
+
+
+class ProgressBarGroup(VGroup):
+    """
+    A container that animates several ProgressBar instances in lockstep.
+
+    When multiple bars progress together, playing one animation per bar
+    makes manim evaluate N independent updaters every frame. This group
+    keeps the per-bar progress values in a NumPy array (SoA layout),
+    computes all of them with one vectorized expression per frame, and
+    writes the results back to the bars in a single Python tick.
+
+    Parameters
+    ----------
+    *bars : ProgressBar
+        The progress bars to drive together.
+
+    Examples
+    --------
+    Lockstep auto-progression:
+        group = ProgressBarGroup(bar1, bar2, bar3)
+        self.play(FadeIn(group))
+        self.play(group.auto_progress(duration=4.0))
+    """
+
+    def __init__(self, *bars, **kwargs):
+        super().__init__(**kwargs)
+        self.bars = list(bars)
+        self.add(*bars)
+        # SoA 布局：每个进度条占一个槽位，每帧向量化计算所有进度
+        self.progress = np.zeros(len(self.bars))
+
+    def auto_progress(self, duration=5.0, start_progress=0.0, end_progress=1.0,
+                      rate_func=lut_smooth):
+        """
+        让所有进度条按同一时间轴自动推进
+        :param duration: 总时长（秒）
+        :param start_progress: 起始进度（0-1），标量或逐条序列，默认0
+        :param end_progress: 结束进度（0-1），标量或逐条序列，默认1.0（100%）
+        :param rate_func: 缓动函数（默认查表版 lut_smooth，与单条进度条的
+            auto_progress 一致）
+        :return: 动画对象
+        """
+        count = len(self.bars)
+        # 起止进度按 SoA 数组存放（支持逐条不同的起止值），跨进度条的
+        # 插值和钳制都交给 NumPy 在 C 层批量完成
+        start = np.clip(
+            np.broadcast_to(np.asarray(start_progress, dtype=float), (count,)).copy(),
+            0.0, 1.0
+        )
+        end = np.clip(
+            np.broadcast_to(np.asarray(end_progress, dtype=float), (count,)).copy(),
+            0.0, 1.0
+        )
+        span = end - start
+
+        # 初始化起始状态
+        for bar, progress in zip(self.bars, start):
+            bar.update_progress_instant(float(progress))
+        np.copyto(self.progress, start)
+
+        def update_group(mob, alpha):
+            # 一次向量化计算本帧所有进度条的进度（写入预分配数组，不产生
+            # 临时对象），再统一写回各个进度条
+            np.multiply(span, alpha, out=self.progress)
+            self.progress += start
+            for bar, progress in zip(self.bars, self.progress):
+                # 入口处已刷新过几何缓存，帧内直接走快速路径
+                bar._apply_progress(float(progress))
+
+        return UpdateFromAlphaFunc(
+            self,
+            update_group,
+            run_time=duration,
+            rate_func=rate_func
+        )